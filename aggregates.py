@@ -0,0 +1,249 @@
+"""Mergeable aggregates for calculator history statistics."""
+
+import math
+from typing import Dict, Any, Iterable, List, Optional
+
+# 2 ** 1074 turns every finite double into an integer
+_FLOAT_SCALE = 2 ** 1074
+
+
+def _scaled_sum(values: List[float]) -> int:
+    """Exact sum of finite floats, as an integer multiple of 2 ** -1074."""
+    return sum(n * (_FLOAT_SCALE // d) for n, d in map(float.as_integer_ratio, values))
+
+
+def _round_scaled(scaled: int) -> float:
+    try:
+        return scaled / _FLOAT_SCALE
+    except OverflowError:
+        return math.inf if scaled > 0 else -math.inf
+
+
+def _finite_partials(values: List[float]) -> Optional[List[float]]:
+    """A short list of floats whose exact sum equals that of ``values``.
+
+    ``values`` must be finite. Returns None if the sum does not fit in
+    a double, since fsum cannot represent it then.
+    """
+    partials = []
+    try:
+        total = math.fsum(values)
+        while total:
+            partials.append(total)
+            total = math.fsum(values + [-partial for partial in partials])
+    except OverflowError:
+        return None
+    return partials
+
+
+def _combine_special(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    """Combine inf/NaN float sums the way fsum would."""
+    if first is None:
+        return second
+    if second is None or first == second:
+        return first
+    # NaN with anything, or inf with -inf
+    return math.nan
+
+
+def _is_older(position: Optional[int], current: Optional[int]) -> bool:
+    return position is not None and current is not None and position < current
+
+
+class StatsAccumulator:
+    """Partial statistics over a run of history entries.
+
+    Accumulators can be merged, so statistics for separately stored
+    groups of entries can be combined without rescanning them.
+
+    By default results are summed left to right, as ``sum()`` would. With
+    ``exact`` the sum is kept exactly instead, so the total does not depend
+    on how entries were grouped; the average is then correctly rounded.
+    Non-float results are added as-is. Finite floats are kept as exact
+    partials, or as a scaled integer once their sum leaves the double
+    range, and inf/NaN results are tracked separately.
+
+    NaN results follow a single left-to-right ``max()``/``min()``: they
+    are skipped, unless the oldest result is NaN, in which case both
+    bounds are that NaN. When entries carry positions, ties between equal
+    bounds go to the oldest position; otherwise to the earlier partial.
+    """
+
+    def __init__(self, exact: bool = False):
+        self.exact = exact
+        self.count = 0
+        self.operation_types: Dict[str, int] = {}
+        self.running_total = 0
+        self.exact_total = 0
+        self.float_partials: List[float] = []
+        # Exact finite float sum once it no longer fits in partials
+        self.float_scaled: Optional[int] = None
+        # Combined inf/NaN float results, if any
+        self.float_special: Optional[float] = None
+        # Oldest result seen, which decides whether the bounds are NaN
+        self.first_result: Optional[Any] = None
+        # Bounds over the non-NaN results only, and where they came from
+        self.max_result: Optional[Any] = None
+        self.min_result: Optional[Any] = None
+        self.max_position: Optional[int] = None
+        self.min_position: Optional[int] = None
+
+    def update(self, entries: Iterable[Dict[str, Any]],
+               positions: Optional[List[int]] = None) -> None:
+        """Account for a batch of history entries, oldest first.
+
+        ``positions`` optionally gives each entry's place in the whole
+        history, for breaking ties when partials are merged out of order.
+        """
+        operation_types = self.operation_types
+        results = []
+        for entry in entries:
+            op_type = entry['operation']
+            operation_types[op_type] = operation_types.get(op_type, 0) + 1
+            results.append(entry['result'])
+        self._update_results(results, positions)
+
+    def update_columns(self, operations: List[str], results: List[Any],
+                       positions: Optional[List[int]] = None) -> None:
+        """Like ``update``, for entries given as parallel columns."""
+        operation_types = self.operation_types
+        for op_type in operations:
+            operation_types[op_type] = operation_types.get(op_type, 0) + 1
+        self._update_results(results, positions)
+
+    def _update_results(self, results: List[Any], positions: Optional[List[int]]) -> None:
+        if not results:
+            return
+
+        if self.exact:
+            floats = [result for result in results if isinstance(result, float)]
+            if len(floats) < len(results):
+                self.exact_total = sum(
+                    (result for result in results if not isinstance(result, float)),
+                    self.exact_total
+                )
+            total = sum(floats)
+            if floats:
+                self._add_floats(floats, total)
+        else:
+            self.running_total = total = sum(results, self.running_total)
+
+        if self.count == 0:
+            self.first_result = results[0]
+        numbers = results
+        if total != total:
+            # A NaN result always makes the sum NaN, so only filter then
+            keep = [result == result for result in results]
+            numbers = [result for result, kept in zip(results, keep) if kept]
+            if positions is not None:
+                positions = [position for position, kept in zip(positions, keep) if kept]
+        if numbers:
+            max_result, min_result = max(numbers), min(numbers)
+            max_position = min_position = None
+            if positions is not None:
+                # index() finds the first equal item, the one max()/min() return
+                max_position = positions[numbers.index(max_result)]
+                min_position = positions[numbers.index(min_result)]
+            self._update_bounds(max_result, min_result, max_position, min_position)
+        self.count += len(results)
+
+    def _add_floats(self, floats: List[float], plain_sum: float) -> None:
+        if not math.isfinite(plain_sum):
+            # Either an inf/NaN result or a finite overflow; split them out
+            for value in floats:
+                if not math.isfinite(value):
+                    self.float_special = _combine_special(self.float_special, value)
+            floats = [value for value in floats if math.isfinite(value)]
+        self._add_finite(floats, None)
+
+    def _add_finite(self, floats: List[float], scaled: Optional[int]) -> None:
+        """Add finite floats, given as values and/or an exact scaled sum."""
+        if self.float_scaled is None and scaled is None:
+            partials = _finite_partials(self.float_partials + floats)
+            if partials is not None:
+                self.float_partials = partials
+                return
+        if self.float_scaled is None:
+            self.float_scaled = _scaled_sum(self.float_partials)
+            self.float_partials = []
+        self.float_scaled += _scaled_sum(floats) + (scaled or 0)
+
+    def merge(self, other: 'StatsAccumulator') -> None:
+        """Fold another accumulator into this one.
+
+        ``other`` is treated as covering entries newer than this one.
+        """
+        if other.count == 0:
+            return
+        if other.exact != self.exact:
+            raise ValueError("Cannot merge exact and running statistics")
+        for op_type, op_count in other.operation_types.items():
+            self.operation_types[op_type] = self.operation_types.get(op_type, 0) + op_count
+        if self.exact:
+            self.exact_total += other.exact_total
+            self.float_special = _combine_special(self.float_special, other.float_special)
+            if other.float_partials or other.float_scaled is not None:
+                self._add_finite(other.float_partials, other.float_scaled)
+        else:
+            self.running_total += other.running_total
+        if self.count == 0:
+            self.first_result = other.first_result
+        if other.max_result is not None:
+            self._update_bounds(other.max_result, other.min_result,
+                                other.max_position, other.min_position)
+        self.count += other.count
+
+    def _update_bounds(self, max_result: Any, min_result: Any,
+                       max_position: Optional[int], min_position: Optional[int]) -> None:
+        if self.max_result is None:
+            self.max_result, self.max_position = max_result, max_position
+            self.min_result, self.min_position = min_result, min_position
+            return
+        # Ties keep the older value, like max() and min() do
+        if max_result > self.max_result or (
+                max_result == self.max_result and _is_older(max_position, self.max_position)):
+            self.max_result, self.max_position = max_result, max_position
+        if min_result < self.min_result or (
+                min_result == self.min_result and _is_older(min_position, self.min_position)):
+            self.min_result, self.min_position = min_result, min_position
+
+    def _float_total(self) -> Optional[float]:
+        if self.float_special is not None:
+            return self.float_special
+        if self.float_scaled is not None:
+            return _round_scaled(self.float_scaled)
+        if self.float_partials:
+            return math.fsum(self.float_partials)
+        return None
+
+    @property
+    def total(self) -> Any:
+        """Sum of all results seen so far."""
+        if not self.exact:
+            return self.running_total
+        float_total = self._float_total()
+        if float_total is None:
+            return self.exact_total
+        return self.exact_total + float_total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render in the format returned by ``History.get_statistics``."""
+        if self.count == 0:
+            return {
+                'total_operations': 0,
+                'operation_types': {},
+                'average_result': None,
+                'max_result': None,
+                'min_result': None
+            }
+
+        max_result, min_result = self.max_result, self.min_result
+        if self.first_result != self.first_result:
+            max_result = min_result = self.first_result
+        return {
+            'total_operations': self.count,
+            'operation_types': dict(self.operation_types),
+            'average_result': self.total / self.count,
+            'max_result': max_result,
+            'min_result': min_result
+        }
@@ -0,0 +1,82 @@
+"""Benchmark partitioned History statistics and search.
+
+Fills one History per partition count and times get_statistics and
+search_operations serially and on a thread and process pool, checking
+every pooled result against the serial one for that partition count.
+The last column is the time relative to that serial run. Pools only
+receive the operation and result columns, but copying those still costs
+time, so whether a pool beats the serial path depends on the machine's
+cores and the history size; this script measures it rather than
+assuming it.
+
+Usage: python benchmarks/bench_partitions.py [--entries N] [--partitions 1 2 4 8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history import History  # noqa: E402
+
+OPERATIONS = ['add', 'subtract', 'multiply', 'divide', 'power', 'square_root']
+
+
+def fill(history, entries, seed=0):
+    rng = random.Random(seed)
+    for i in range(entries):
+        history.add_operation(OPERATIONS[i % len(OPERATIONS)], [i, 1], rng.uniform(-1e6, 1e6))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=10 ** 7)
+    parser.add_argument('--partitions', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--partition-by', choices=['time', 'operation'], default='time')
+    args = parser.parse_args()
+
+    exact_stats = None
+    print(f"{args.entries} entries, partition_by={args.partition_by}")
+    print(f"{'partitions':>10}{'pool':>9}{'stats s':>10}{'search s':>10}{'vs serial':>11}")
+    for partitions in args.partitions:
+        history = History(max_size=args.entries, partitions=partitions,
+                          partition_by=args.partition_by)
+        fill(history, args.entries)
+
+        pools = [('serial', None)]
+        if partitions > 1:
+            pools += [('thread', ThreadPoolExecutor(partitions)),
+                      ('process', ProcessPoolExecutor(partitions))]
+        for pool_name, executor in pools:
+            stats_time, stats = timed(lambda: history.get_statistics(executor=executor))
+            search_time, found = timed(lambda: history.search_operations('divide', executor=executor))
+            if executor is not None:
+                executor.shutdown()
+
+            if executor is None:
+                serial_stats, serial_search = stats, found
+                serial_time = stats_time + search_time
+            assert stats == serial_stats, "statistics differ from the serial path"
+            assert [op['result'] for op in found] == [op['result'] for op in serial_search], \
+                "search results differ from the serial path"
+            if partitions > 1:
+                # Partitioned sums are exact, so every partition count agrees
+                exact_stats = exact_stats or stats
+                assert stats == exact_stats, "statistics differ between partition counts"
+            relative = (stats_time + search_time) / serial_time
+            print(f"{partitions:>10}{pool_name:>9}{stats_time:>10.3f}{search_time:>10.3f}{relative:>10.2f}x")
+        del history
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark Calculator.power across exponent classes.
+
+Compares the current implementation with the original
+``base ** exponent`` followed by nan/inf checks.
+
+Usage: python benchmarks/bench_power.py [--number N]
+"""
+
+import argparse
+import math
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator import Calculator  # noqa: E402
+
+
+class ReferenceCalculator(Calculator):
+    """Calculator with the original power implementation, for comparison."""
+
+    def power(self, base, exponent):
+        try:
+            if base < 0 and not isinstance(exponent, int):
+                raise ValueError("Cannot raise negative number to non-integer power")
+            result = base ** exponent
+            if math.isnan(result) or math.isinf(result):
+                raise ValueError("Operation resulted in invalid number")
+            self.last_result = result
+            return result
+        except OverflowError:
+            raise ValueError("Operation resulted in overflow")
+
+
+CASES = [
+    ("small int exponent", 7, 5),
+    ("negative int exponent", 7, -5),
+    ("large int result", 3, 600),
+    ("int overflow", 10, 5000),
+    ("huge int overflow", 10, 10**6),
+    ("square root", 12345.678, 0.5),
+    ("float exponent", 12345.678, 1.7),
+]
+
+
+def _call(func, base, exponent):
+    try:
+        func(base, exponent)
+    except ValueError:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per case")
+    args = parser.parse_args()
+
+    reference_power = ReferenceCalculator().power
+    current_power = Calculator().power
+    print(f"{'case':<24}{'reference us':>14}{'current us':>14}{'speedup':>12}")
+    for name, base, exponent in CASES:
+        number = args.number if exponent < 10**5 else max(1, args.number // 1000)
+        reference = timeit.timeit(lambda: _call(reference_power, base, exponent), number=number)
+        current = timeit.timeit(lambda: _call(current_power, base, exponent), number=number)
+        print(f"{name:<24}{reference / number * 1e6:>14.3f}"
+              f"{current / number * 1e6:>14.3f}{reference / current:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 """Calculator class with basic mathematical operations."""
 
 import math
+import sys
 from typing import Union
 
 Number = Union[int, float]
 
+# Integers of this many bits or more cannot be converted to float
+_FLOAT_MAX_BITS = sys.float_info.max_exp
+
 
 class Calculator:
     """A calculator class with basic mathematical operations."""
@@ -35,11 +39,32 @@ class Calculator:
         return result
     
     def power(self, base: Number, exponent: Number) -> Number:
-        """Raises base to the power of exponent."""
+        """Raises base to the power of exponent.
+        
+        Exponent 0.5 is computed with ``math.sqrt``, which is correctly
+        rounded and can differ from ``base ** 0.5`` in the last bit.
+        """
         try:
+            if type(base) is int and type(exponent) is int and exponent >= 0:
+                # The result has between (bits - 1) * exponent and
+                # bits * exponent bits, so hopeless cases are rejected
+                # before the integer is built. Int ** already squares.
+                bits = base.bit_length()
+                if (bits - 1) * exponent >= _FLOAT_MAX_BITS:
+                    raise OverflowError
+                result = base ** exponent
+                if bits * exponent >= _FLOAT_MAX_BITS:
+                    # Near the boundary: rounding decides whether it fits
+                    float(result)
+                self.last_result = result
+                return result
             if base < 0 and not isinstance(exponent, int):
                 raise ValueError("Cannot raise negative number to non-integer power")
-            result = base ** exponent
+            if exponent == 0.5:
+                # sqrt(-0.0) is -0.0, but (-0.0) ** 0.5 is 0.0
+                result = math.sqrt(base) if base != 0 else 0.0
+            else:
+                result = base ** exponent
             if math.isnan(result) or math.isinf(result):
                 raise ValueError("Operation resulted in invalid number")
             self.last_result = result
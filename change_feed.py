@@ -0,0 +1,97 @@
+"""Single-producer change feed for history entries."""
+
+from typing import List, Tuple, Dict, Any, Optional
+
+
+class FeedOverrunError(Exception):
+    """Raised when a subscriber falls behind the feed's capacity.
+
+    ``missed`` is the number of entries that were overwritten before the
+    subscriber could read them. The cursor has already been moved to the
+    oldest entry still available, so draining can simply be retried.
+    """
+
+    def __init__(self, missed: int):
+        super().__init__(f"Subscriber fell behind and missed {missed} entries")
+        self.missed = missed
+
+
+class ChangeFeed:
+    """Bounded ring buffer of history entries with sequence numbers.
+
+    There is one producer (the owning ``History``) and any number of
+    cursors, each drained by a single consumer thread. No lock is taken:
+    the producer fills a slot before publishing its sequence number, and
+    each slot records the sequence number it holds so readers can detect
+    a slot overwritten while they were copying it.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Change feed capacity must be positive")
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[int, Dict[str, Any]]]] = [None] * capacity
+        # Sequence number of the next entry to be published
+        self.next_sequence = 0
+
+    def publish(self, entry: Dict[str, Any]) -> int:
+        """Append an entry and return its sequence number."""
+        sequence = self.next_sequence
+        self._slots[sequence % self.capacity] = (sequence, entry)
+        self.next_sequence = sequence + 1
+        return sequence
+
+    def subscribe(self, from_start: bool = False) -> 'FeedCursor':
+        """Create a cursor positioned at the next published entry.
+
+        With ``from_start`` the cursor begins at the oldest entry still
+        held in the buffer instead.
+        """
+        if from_start:
+            return FeedCursor(self, max(0, self.next_sequence - self.capacity))
+        return FeedCursor(self, self.next_sequence)
+
+
+class FeedCursor:
+    """A subscriber's read position in a ``ChangeFeed``."""
+
+    def __init__(self, feed: ChangeFeed, position: int):
+        self.feed = feed
+        self.position = position
+
+    def pending(self) -> int:
+        """Number of published entries not yet drained."""
+        return self.feed.next_sequence - self.position
+
+    def drain(self, max_items: Optional[int] = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """Return new ``(sequence, entry)`` pairs, oldest first.
+
+        Raises ``FeedOverrunError`` if entries were overwritten before
+        being read.
+        """
+        feed = self.feed
+        head = feed.next_sequence
+        if self.position < head - feed.capacity:
+            self._overrun(head - feed.capacity)
+
+        end = head
+        if max_items is not None:
+            end = min(end, self.position + max(0, max_items))
+
+        batch = []
+        slots = feed._slots
+        capacity = feed.capacity
+        for sequence in range(self.position, end):
+            slot = slots[sequence % capacity]
+            if slot is None or slot[0] != sequence:
+                # The producer lapped us while we were reading
+                self._overrun(feed.next_sequence - capacity)
+            batch.append(slot)
+
+        self.position = end
+        return batch
+
+    def _overrun(self, oldest_available: int) -> None:
+        missed = oldest_available - self.position
+        self.position = oldest_available
+        raise FeedOverrunError(missed)
@@ -0,0 +1,146 @@
+"""Compressed cold tier for entries evicted from the in-memory history."""
+
+import pickle
+import zlib
+from collections import deque
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Iterator
+
+from aggregates import StatsAccumulator
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class CompressedBlock:
+    """A packed, compressed run of consecutive history entries.
+
+    Timestamps are stored as microsecond deltas and operation names as
+    codes from the owning tier's dictionary. The uncompressed summary is
+    kept alongside the payload so queries can skip the block entirely.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], op_codes: Dict[str, int],
+                 exact_statistics: bool = False):
+        timestamps = [(entry['timestamp'] - _EPOCH) // _MICROSECOND for entry in entries]
+        deltas = [timestamps[0]] + [
+            current - previous for previous, current in zip(timestamps, timestamps[1:])
+        ]
+        codes = [op_codes[entry['operation']] for entry in entries]
+        payload = (
+            deltas,
+            codes,
+            [entry['operands'] for entry in entries],
+            [entry['result'] for entry in entries]
+        )
+        self.data = zlib.compress(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+        self.count = len(entries)
+        self.codes = frozenset(codes)
+        self.first_timestamp = entries[0]['timestamp']
+        self.last_timestamp = entries[-1]['timestamp']
+        self.summary = StatsAccumulator(exact_statistics)
+        self.summary.update(entries)
+
+    @property
+    def size(self) -> int:
+        """Size of the compressed payload in bytes."""
+        return len(self.data)
+
+    def decode(self, op_names: List[str]) -> List[Dict[str, Any]]:
+        """Unpack the block into history entries, oldest first."""
+        deltas, codes, operands, results = pickle.loads(zlib.decompress(self.data))
+        entries = []
+        timestamp = 0
+        for delta, code, entry_operands, result in zip(deltas, codes, operands, results):
+            timestamp += delta
+            entries.append({
+                'timestamp': _EPOCH + timestamp * _MICROSECOND,
+                'operation': op_names[code],
+                'operands': entry_operands,
+                'result': result
+            })
+        return entries
+
+
+class ColdTier:
+    """Byte-budgeted store of compressed history blocks.
+
+    Entries are staged uncompressed until ``block_size`` of them have
+    accumulated, then packed into a ``CompressedBlock``. When the packed
+    blocks exceed ``max_bytes`` the oldest blocks are dropped.
+    Block summaries use exact sums when ``exact_statistics`` is set.
+    """
+
+    def __init__(self, max_bytes: int, block_size: int = 64, exact_statistics: bool = False):
+        if max_bytes < 0:
+            raise ValueError("Cold tier byte budget cannot be negative")
+        if block_size <= 0:
+            raise ValueError("Cold tier block size must be positive")
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        self.exact_statistics = exact_statistics
+        self.blocks = deque()
+        self.staging: List[Dict[str, Any]] = []
+        self.op_codes: Dict[str, int] = {}
+        self.op_names: List[str] = []
+        self.compressed_bytes = 0
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Add an entry evicted from the hot tier."""
+        if entry['operation'] not in self.op_codes:
+            self.op_codes[entry['operation']] = len(self.op_names)
+            self.op_names.append(entry['operation'])
+        self.staging.append(entry)
+        if len(self.staging) >= self.block_size:
+            self._seal_block()
+
+    def _seal_block(self) -> None:
+        block = CompressedBlock(self.staging, self.op_codes, self.exact_statistics)
+        self.staging = []
+        self.blocks.append(block)
+        self.compressed_bytes += block.size
+
+        while self.blocks and self.compressed_bytes > self.max_bytes:
+            self.compressed_bytes -= self.blocks.popleft().size
+
+    def clear(self) -> None:
+        """Drop all cold entries."""
+        self.blocks.clear()
+        self.staging.clear()
+        self.op_codes.clear()
+        self.op_names.clear()
+        self.compressed_bytes = 0
+
+    def count(self) -> int:
+        return sum(block.count for block in self.blocks) + len(self.staging)
+
+    def _iter_newest_first(self, operation_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        for entry in reversed(self.staging):
+            if operation_type is None or entry['operation'] == operation_type:
+                yield entry
+
+        code = self.op_codes.get(operation_type) if operation_type is not None else None
+        for block in reversed(self.blocks):
+            if operation_type is not None and code not in block.codes:
+                continue
+            for entry in reversed(block.decode(self.op_names)):
+                if operation_type is None or entry['operation'] == operation_type:
+                    yield entry
+
+    def search_operations(self, operation_type: str) -> List[Dict[str, Any]]:
+        """Search cold entries by type, most recent first.
+
+        Blocks whose summary does not contain the operation are not
+        decompressed.
+        """
+        if operation_type not in self.op_codes:
+            return []
+        return list(self._iter_newest_first(operation_type))
+
+    def get_statistics_accumulator(self) -> StatsAccumulator:
+        """Aggregate all cold entries, oldest first, using block summaries."""
+        accumulator = StatsAccumulator(self.exact_statistics)
+        for block in self.blocks:
+            accumulator.merge(block.summary)
+        accumulator.update(self.staging)
+        return accumulator
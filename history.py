@@ -1,15 +1,114 @@
 """History class for storing and managing calculator operation history."""
 
+import sys
+import zlib
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+from aggregates import StatsAccumulator
+from change_feed import ChangeFeed, FeedCursor
+from cold_storage import ColdTier
+
+# Approximate fixed cost of one entry: the dict itself plus its timestamp.
+# Operands and result are sized individually on insert.
+_ENTRY_OVERHEAD = (
+    sys.getsizeof({'timestamp': None, 'operation': None, 'operands': None, 'result': None})
+    + sys.getsizeof(datetime.now())
+)
+
+PARTITION_SCHEMES = ('time', 'operation')
+
+# Entry limit used when neither max_size nor max_bytes is given
+DEFAULT_MAX_SIZE = 100
+
+
+def _partition_statistics(entries: Iterable[Dict[str, Any]], positions: Optional[List[int]],
+                          exact: bool) -> StatsAccumulator:
+    accumulator = StatsAccumulator(exact)
+    accumulator.update(entries, positions)
+    return accumulator
+
+
+def _column_statistics(operations: List[str], results: List[Any], positions: Optional[List[int]],
+                       exact: bool) -> StatsAccumulator:
+    accumulator = StatsAccumulator(exact)
+    accumulator.update_columns(operations, results, positions)
+    return accumulator
+
+
+def _partition_search(entries: Iterable[Dict[str, Any]], operation_type: str) -> List[Dict[str, Any]]:
+    return [op for op in entries if op['operation'] == operation_type]
+
+
+def _column_search(operations: List[str], operation_type: str) -> List[int]:
+    return [index for index, op_type in enumerate(operations) if op_type == operation_type]
 
 
 class History:
-    """Manages history of calculator operations."""
+    """Manages history of calculator operations.
+    
+    By default entries evicted past ``max_size`` are discarded. Passing
+    ``cold_max_bytes`` enables tiered mode: the newest ``max_size`` entries
+    stay in memory as-is and older ones are packed into compressed blocks
+    of ``cold_block_size`` entries, bounded by ``cold_max_bytes``.
+    
+    ``max_bytes`` bounds the approximate memory held by the in-memory
+    entries instead of their count; the oldest are evicted until it is
+    respected. ``max_size`` defaults to 100 only when no byte budget is
+    given; passing both applies both. Entry sizes are only estimated
+    when ``max_bytes`` is set.
+    
+    ``subscribe`` returns a cursor over a change feed of every added
+    entry, which consumers can drain from another thread.
     
-    def __init__(self, max_size: int = 100):
+    With ``partitions`` greater than one, statistics and searches run as
+    map-reduce over the partitions. The map step can be handed to a
+    caller-supplied thread or process pool, which receives only the
+    operation and result columns; whether that is faster than the serial
+    path depends on the available cores and the pickling cost.
+    ``partition_by='time'`` splits the history into equal contiguous time
+    ranges; ``partition_by='operation'`` also stores entries per partition
+    by a hash of the operation name, so a search only has to scan one
+    partition. Partitioned statistics sum
+    results exactly so that the merged average does not depend on the
+    partitioning or the pool; it is correctly rounded and can differ in
+    the last bit from the left-to-right sum used without partitions.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None, cold_max_bytes: Optional[int] = None,
+                 cold_block_size: int = 64, max_bytes: Optional[int] = None,
+                 partitions: int = 1, partition_by: str = 'time'):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("History byte budget cannot be negative")
+        if partitions < 1:
+            raise ValueError("Partition count must be positive")
+        if partition_by not in PARTITION_SCHEMES:
+            raise ValueError(f"Unknown partitioning: {partition_by}")
+        if max_size is None and max_bytes is None:
+            max_size = DEFAULT_MAX_SIZE
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.operations: List[Dict[str, Any]] = []
+        # Approximate size of each entry in self.operations, in the same order
+        self._entry_sizes: List[int] = []
+        self._memory_usage = 0
+        self.partitions = partitions
+        self.partition_by = partition_by
+        self.exact_statistics = partitions > 1
+        self.cold: Optional[ColdTier] = None
+        if cold_max_bytes is not None:
+            self.cold = ColdTier(cold_max_bytes, cold_block_size, self.exact_statistics)
+        self.feed: Optional[ChangeFeed] = None
+        # Per-partition entries, oldest first, when partitioning by operation,
+        # with each entry's insertion position for ordering merged results
+        self._operation_partitions: Optional[List[List[Dict[str, Any]]]] = None
+        self._operation_positions: Optional[List[List[int]]] = None
+        self._added = 0
+        if partition_by == 'operation' and partitions > 1:
+            self._operation_partitions = [[] for _ in range(partitions)]
+            self._operation_positions = [[] for _ in range(partitions)]
     
     def add_operation(self, operation: str, operands: List[float], result: float) -> None:
         """Add an operation to history."""
@@ -21,10 +120,78 @@ class History:
         }
         
         self.operations.append(entry)
+        if self.max_bytes is not None:
+            size = _ENTRY_OVERHEAD + sys.getsizeof(entry['operands']) + sys.getsizeof(result)
+            for operand in entry['operands']:
+                size += sys.getsizeof(operand)
+            self._entry_sizes.append(size)
+            self._memory_usage += size
+        if self._operation_partitions is not None:
+            index = self._partition_index(operation)
+            self._operation_partitions[index].append(entry)
+            self._operation_positions[index].append(self._added)
+        self._added += 1
+        if self.feed is not None:
+            self.feed.publish(entry)
         
         # Remove oldest entries if we exceed max_size
-        if len(self.operations) > self.max_size:
-            self.operations.pop(0)
+        if self.max_size is not None and len(self.operations) > self.max_size:
+            self._evict_oldest()
+        
+        # Then keep evicting until we are within the byte budget
+        if self.max_bytes is not None:
+            while self.operations and self._memory_usage > self.max_bytes:
+                self._evict_oldest()
+    
+    def _evict_oldest(self) -> None:
+        entry = self.operations.pop(0)
+        if self.max_bytes is not None:
+            self._memory_usage -= self._entry_sizes.pop(0)
+        if self._operation_partitions is not None:
+            index = self._partition_index(entry['operation'])
+            self._operation_partitions[index].pop(0)
+            self._operation_positions[index].pop(0)
+        if self.cold is not None:
+            self.cold.append(entry)
+    
+    def _partition_index(self, operation: str) -> int:
+        # crc32 rather than hash() so placement is stable across processes
+        return zlib.crc32(operation.encode('utf-8')) % self.partitions
+    
+    def _partition_bounds(self) -> List[range]:
+        """Index ranges of the time partitions in self.operations."""
+        total = len(self.operations)
+        bounds = [total * i // self.partitions for i in range(self.partitions + 1)]
+        return [range(start, end) for start, end in zip(bounds, bounds[1:])]
+    
+    def _partitioned_entries(self) -> List[Iterable[Dict[str, Any]]]:
+        """Current partitions, each oldest first, read in place."""
+        if self._operation_partitions is not None:
+            return self._operation_partitions
+        if self.partitions == 1:
+            return [self.operations]
+        return [map(self.operations.__getitem__, indexes) for indexes in self._partition_bounds()]
+    
+    @staticmethod
+    def _map_partitions(func: Callable, tasks: List[tuple], executor: Optional[Executor],
+                        *args: Any) -> List[Any]:
+        """Run ``func(*task, *args)`` for every task, on ``executor`` if given."""
+        if executor is None or len(tasks) == 1:
+            return [func(*task, *args) for task in tasks]
+        columns = [list(column) for column in zip(*tasks)]
+        return list(executor.map(func, *columns, *(repeat(arg, len(tasks)) for arg in args)))
+    
+    def subscribe(self, from_start: bool = False) -> FeedCursor:
+        """Subscribe to entries added from now on.
+        
+        The feed holds up to ``max_size`` undrained entries (100 when only
+        a byte budget is set); a cursor that falls further behind gets a
+        ``FeedOverrunError`` from ``drain``.
+        """
+        if self.feed is None:
+            capacity = self.max_size if self.max_size is not None else DEFAULT_MAX_SIZE
+            self.feed = ChangeFeed(max(capacity, 1))
+        return self.feed.subscribe(from_start)
     
     def get_last_operations(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get the last N operations, most recent first."""
@@ -39,38 +206,100 @@ class History:
     def clear_history(self) -> None:
         """Clear all operations from history."""
         self.operations.clear()
+        self._entry_sizes.clear()
+        self._memory_usage = 0
+        if self._operation_partitions is not None:
+            for partition in self._operation_partitions:
+                partition.clear()
+            for partition_positions in self._operation_positions:
+                partition_positions.clear()
+        if self.cold is not None:
+            self.cold.clear()
+    
+    def get_memory_usage(self) -> Optional[int]:
+        """Approximate bytes held by the in-memory entries, tracked on insert.
+        
+        Returns None unless ``max_bytes`` is set. Entries evicted while a
+        change feed subscriber exists stay alive in the feed's buffer until
+        overwritten; that memory is not counted here.
+        """
+        if self.max_bytes is None:
+            return None
+        return self._memory_usage
+    
+    def get_operation_count(self, include_cold: bool = False) -> int:
+        count = len(self.operations)
+        if include_cold and self.cold is not None:
+            count += self.cold.count()
+        return count
     
-    def get_operation_count(self) -> int:
-        return len(self.operations)
-    
-    def search_operations(self, operation_type: str) -> List[Dict[str, Any]]:
-        """Search for operations by type."""
-        matching_ops = [op for op in self.operations if op['operation'] == operation_type]
-        return matching_ops[::-1]
-    
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get statistics about the operations history."""
-        if not self.operations:
-            return {
-                'total_operations': 0,
-                'operation_types': {},
-                'average_result': None,
-                'max_result': None,
-                'min_result': None
-            }
+    def search_operations(self, operation_type: str, include_cold: bool = False,
+                          executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
+        """Search for operations by type.
+        
+        With ``include_cold`` the compressed tier is searched as well,
+        after the in-memory entries. Time partitions are scanned on
+        ``executor`` when one is given.
+        """
+        if self._operation_partitions is not None:
+            # Only one partition can hold this operation
+            partition = self._operation_partitions[self._partition_index(operation_type)]
+            matching_ops = _partition_search(partition, operation_type)
+            matching_ops.reverse()
+        elif executor is None or self.partitions == 1:
+            matching_ops = []
+            for partition in reversed(self._partitioned_entries()):
+                partial = _partition_search(partition, operation_type)
+                partial.reverse()
+                matching_ops.extend(partial)
+        else:
+            # Workers only see the operation names and return indexes
+            operations = self.operations
+            bounds = self._partition_bounds()
+            tasks = [([operations[i]['operation'] for i in indexes],) for indexes in bounds]
+            partials = self._map_partitions(_column_search, tasks, executor, operation_type)
+            matching_ops = []
+            for indexes, partial in zip(reversed(bounds), reversed(partials)):
+                matching_ops.extend(operations[indexes[i]] for i in reversed(partial))
+        if include_cold and self.cold is not None:
+            matching_ops.extend(self.cold.search_operations(operation_type))
+        return matching_ops
+    
+    def get_statistics(self, include_cold: bool = False,
+                       executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """Get statistics about the operations history.
+        
+        With ``include_cold`` the compressed tier is included, using the
+        per-block summaries rather than decompressing it. Partitions are
+        aggregated on ``executor`` when one is given; the result is the
+        same as the serial one.
+        """
+        if include_cold and self.cold is not None:
+            accumulator = self.cold.get_statistics_accumulator()
+        else:
+            accumulator = StatsAccumulator(self.exact_statistics)
         
-        operation_types = {}
-        results = []
+        partitions = self._partitioned_entries()
+        positions = self._operation_positions or [None] * len(partitions)
+        if executor is None or len(partitions) == 1:
+            tasks = list(zip(partitions, positions))
+            partials = self._map_partitions(_partition_statistics, tasks, None, self.exact_statistics)
+        else:
+            # Ship only the columns the statistics need, not whole entries
+            tasks = []
+            for partition, partition_positions in zip(partitions, positions):
+                partition = list(partition)
+                tasks.append(([op['operation'] for op in partition],
+                              [op['result'] for op in partition], partition_positions))
+            partials = self._map_partitions(_column_statistics, tasks, executor, self.exact_statistics)
         
-        for op in self.operations:
-            op_type = op['operation']
-            operation_types[op_type] = operation_types.get(op_type, 0) + 1
-            results.append(op['result'])
+        hot = StatsAccumulator(self.exact_statistics)
+        for partial in partials:
+            hot.merge(partial)
+        if self._operation_partitions is not None and self.operations:
+            # Operation partitions are not in time order, so take the
+            # oldest result directly; it decides whether bounds are NaN
+            hot.first_result = self.operations[0]['result']
+        accumulator.merge(hot)
         
-        return {
-            'total_operations': len(self.operations),
-            'operation_types': operation_types,
-            'average_result': sum(results) / len(results),
-            'max_result': max(results),
-            'min_result': min(results)
-        }
\ No newline at end of file
+        return accumulator.to_dict()
\ No newline at end of file
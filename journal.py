@@ -0,0 +1,146 @@
+"""Compact binary journal of calculator calls for offline replay.
+
+A journal starts with ``MAGIC`` followed by one record per call::
+
+    u8   operation code (index into OPERATIONS)
+    u64  nanoseconds since the journal was opened
+    ...  operands, one encoded value each
+    ...  outcome: an encoded result value, or an error
+
+Values are a one-byte tag followed by the payload: ``f`` for a float as
+an IEEE 754 double, ``i`` for an int that fits in 64 bits, ``I`` for a
+larger int (u32 length plus signed big-endian bytes) and ``e`` for an
+error (u16 length plus ``"TypeName: message"`` in UTF-8). Floats are
+stored bit for bit, so replayed results can be compared exactly.
+"""
+
+import struct
+import time
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Sequence, Any
+
+MAGIC = b'CALCJRN1'
+
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide', 'power', 'square_root')
+OPERAND_COUNTS = {'square_root': 1}
+
+_OPERATION_CODES = {name: code for code, name in enumerate(OPERATIONS)}
+_HEADER = struct.Struct('<BQ')
+_FLOAT = struct.Struct('<d')
+_INT = struct.Struct('<q')
+_LENGTH = struct.Struct('<I')
+_ERROR_LENGTH = struct.Struct('<H')
+
+
+class UnsupportedValueError(ValueError):
+    """Raised when a value has no journal encoding."""
+
+
+class JournalRecord(NamedTuple):
+    """A single recorded calculator call."""
+    operation: str
+    operands: List[Any]
+    offset_ns: int
+    result: Any
+    error: Optional[str]
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode an int or float operand or result."""
+    if type(value) is float:
+        return b'f' + _FLOAT.pack(value)
+    if isinstance(value, int):
+        value = int(value)
+        if -2 ** 63 <= value < 2 ** 63:
+            return b'i' + _INT.pack(value)
+        data = value.to_bytes(value.bit_length() // 8 + 1, 'big', signed=True)
+        return b'I' + _LENGTH.pack(len(data)) + data
+    raise UnsupportedValueError(f"Cannot journal value of type {type(value).__name__}")
+
+
+def format_error(error: BaseException) -> str:
+    """Describe a raised exception the way the journal stores it."""
+    return f"{type(error).__name__}: {error}"
+
+
+def encode_error(error: BaseException) -> bytes:
+    """Encode a raised exception as its type name and message."""
+    data = format_error(error).encode('utf-8')[:0xFFFF]
+    return b'e' + _ERROR_LENGTH.pack(len(data)) + data
+
+
+class JournalWriter:
+    """Appends calculator calls to a binary journal file.
+
+    Calls involving values that cannot be encoded (anything other than
+    int and float) are left out and counted in ``skipped``.
+    """
+
+    def __init__(self, path: str):
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._start_ns = time.perf_counter_ns()
+        self.skipped = 0
+
+    def record(self, operation: str, operands: Sequence[Any], result: Any = None,
+               error: Optional[BaseException] = None) -> bool:
+        """Write a call and its result, or the error it raised.
+
+        Returns False if the call was skipped as unencodable.
+        """
+        offset_ns = time.perf_counter_ns() - self._start_ns
+        try:
+            parts = [_HEADER.pack(_OPERATION_CODES[operation], offset_ns)]
+            parts.extend(encode_value(operand) for operand in operands)
+            parts.append(encode_error(error) if error is not None else encode_value(result))
+        except UnsupportedValueError:
+            self.skipped += 1
+            return False
+        self._file.write(b''.join(parts))
+        return True
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'JournalWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _read_value(data: bytes, pos: int):
+    tag = data[pos:pos + 1]
+    pos += 1
+    if tag == b'f':
+        return _FLOAT.unpack_from(data, pos)[0], None, pos + _FLOAT.size
+    if tag == b'i':
+        return _INT.unpack_from(data, pos)[0], None, pos + _INT.size
+    if tag == b'I':
+        length = _LENGTH.unpack_from(data, pos)[0]
+        pos += _LENGTH.size
+        return int.from_bytes(data[pos:pos + length], 'big', signed=True), None, pos + length
+    if tag == b'e':
+        length = _ERROR_LENGTH.unpack_from(data, pos)[0]
+        pos += _ERROR_LENGTH.size
+        return None, data[pos:pos + length].decode('utf-8', 'replace'), pos + length
+    raise ValueError(f"Corrupt journal: unknown value tag {tag!r}")
+
+
+def read_journal(path: str) -> Iterator[JournalRecord]:
+    """Yield the records of a journal file in recorded order."""
+    with open(path, 'rb') as journal_file:
+        data = journal_file.read()
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a calculator journal")
+
+    pos = len(MAGIC)
+    while pos < len(data):
+        code, offset_ns = _HEADER.unpack_from(data, pos)
+        pos += _HEADER.size
+        operation = OPERATIONS[code]
+        operands = []
+        for _ in range(OPERAND_COUNTS.get(operation, 2)):
+            operand, _error, pos = _read_value(data, pos)
+            operands.append(operand)
+        result, error, pos = _read_value(data, pos)
+        yield JournalRecord(operation, operands, offset_ns, result, error)
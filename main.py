@@ -1,7 +1,10 @@
 """Calculator with History - A simple calculator that tracks operation history."""
 
+from typing import Optional
+
 from calculator import Calculator
 from history import History
+from journal import JournalWriter
 
 
 class CalculatorWithHistory:
@@ -10,36 +13,51 @@ class CalculatorWithHistory:
     def __init__(self):
         self.calculator = Calculator()
         self.history = History()
+        self.journal: Optional[JournalWriter] = None
     
-    def add(self, a: float, b: float) -> float:
-        result = self.calculator.add(a, b)
-        self.history.add_operation('add', [a, b], result)
+    def _execute(self, operation: str, *operands: float) -> float:
+        try:
+            result = getattr(self.calculator, operation)(*operands)
+        except Exception as error:
+            if self.journal is not None:
+                self.journal.record(operation, operands, error=error)
+            raise
+        self.history.add_operation(operation, list(operands), result)
+        if self.journal is not None:
+            self.journal.record(operation, operands, result)
         return result
     
+    def add(self, a: float, b: float) -> float:
+        return self._execute('add', a, b)
+    
     def subtract(self, a: float, b: float) -> float:
-        result = self.calculator.subtract(a, b)
-        self.history.add_operation('subtract', [a, b], result)
-        return result
+        return self._execute('subtract', a, b)
     
     def multiply(self, a: float, b: float) -> float:
-        result = self.calculator.multiply(a, b)
-        self.history.add_operation('multiply', [a, b], result)
-        return result
+        return self._execute('multiply', a, b)
     
     def divide(self, a: float, b: float) -> float:
-        result = self.calculator.divide(a, b)
-        self.history.add_operation('divide', [a, b], result)
-        return result
+        return self._execute('divide', a, b)
     
     def power(self, base: float, exponent: float) -> float:
-        result = self.calculator.power(base, exponent)
-        self.history.add_operation('power', [base, exponent], result)
-        return result
+        return self._execute('power', base, exponent)
     
     def square_root(self, number: float) -> float:
-        result = self.calculator.square_root(number)
-        self.history.add_operation('square_root', [number], result)
-        return result
+        return self._execute('square_root', number)
+    
+    def start_recording(self, path: str) -> None:
+        """Record every call, including failed ones, to a binary journal.
+        
+        Calls with values the journal cannot encode are skipped, so
+        recording never changes a call's result or exception.
+        """
+        self.stop_recording()
+        self.journal = JournalWriter(path)
+    
+    def stop_recording(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
     
     def get_history(self, count: int = 10):
         return self.history.get_last_operations(count)
@@ -0,0 +1,99 @@
+"""Replay a calculator journal and report throughput and latency.
+
+Usage: python replay.py JOURNAL [--paced]
+"""
+
+import argparse
+import math
+import time
+from typing import Dict, Any, List
+
+from calculator import Calculator
+from history import History
+from journal import encode_value, format_error, read_journal
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def replay_journal(path: str, paced: bool = False) -> Dict[str, Any]:
+    """Re-execute a journal against a fresh Calculator and History.
+
+    By default calls run back to back; with ``paced`` each call waits for
+    its recorded offset from the start. Every outcome is compared with the
+    recorded one by its encoded bytes, so floats must match bit for bit.
+    """
+    records = list(read_journal(path))
+    calculator = Calculator()
+    history = History(max_size=max(len(records), 1))
+    latencies = []
+    mismatches = []
+
+    start = time.perf_counter_ns()
+    for index, record in enumerate(records):
+        if paced:
+            delay = record.offset_ns - (time.perf_counter_ns() - start)
+            if delay > 0:
+                time.sleep(delay / 1e9)
+
+        error_text = None
+        call_start = time.perf_counter_ns()
+        try:
+            result = getattr(calculator, record.operation)(*record.operands)
+            history.add_operation(record.operation, record.operands, result)
+        except Exception as error:
+            error_text = format_error(error)
+        latencies.append(time.perf_counter_ns() - call_start)
+
+        if error_text is not None or record.error is not None:
+            matches = error_text == record.error
+        else:
+            matches = encode_value(result) == encode_value(record.result)
+        if not matches:
+            mismatches.append(index)
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+
+    latencies.sort()
+    report = {
+        'operations': len(records),
+        'elapsed_seconds': elapsed,
+        'throughput': len(records) / elapsed if elapsed > 0 else None,
+        'latency_p50_us': None,
+        'latency_p90_us': None,
+        'latency_p99_us': None,
+        'latency_max_us': None,
+        'mismatches': mismatches
+    }
+    if latencies:
+        report['latency_p50_us'] = _percentile(latencies, 0.50) / 1000
+        report['latency_p90_us'] = _percentile(latencies, 0.90) / 1000
+        report['latency_p99_us'] = _percentile(latencies, 0.99) / 1000
+        report['latency_max_us'] = latencies[-1] / 1000
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a calculator journal.")
+    parser.add_argument('journal', help="path to a journal written by start_recording")
+    parser.add_argument('--paced', action='store_true',
+                        help="replay at the recorded pacing instead of as fast as possible")
+    args = parser.parse_args(argv)
+
+    report = replay_journal(args.journal, paced=args.paced)
+    print(f"Operations: {report['operations']}")
+    print(f"Elapsed: {report['elapsed_seconds']:.6f} s")
+    if report['throughput'] is not None:
+        print(f"Throughput: {report['throughput']:.0f} ops/s")
+    if report['operations']:
+        print(f"Latency p50/p90/p99/max: {report['latency_p50_us']:.2f} / "
+              f"{report['latency_p90_us']:.2f} / {report['latency_p99_us']:.2f} / "
+              f"{report['latency_max_us']:.2f} us")
+    print(f"Mismatches: {len(report['mismatches'])}")
+    return 1 if report['mismatches'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -161,4 +161,28 @@ class TestCalculator:
         assert result == 10.0
         
         result = self.calculator.divide(7, 2)
-        assert result == 3.5
\ No newline at end of file
+        assert result == 3.5
+    
+    def test_integer_power_is_exact(self):
+        """Test that integer powers keep exact integer results."""
+        result = self.calculator.power(3, 40)
+        assert result == 12157665459056928801
+        assert isinstance(result, int)
+        assert self.calculator.power(-2, 1023) == -(2 ** 1023)
+    
+    def test_integer_power_overflow_boundary(self):
+        """Test overflow detection right at the float limit."""
+        assert self.calculator.power(2, 1023) == 2 ** 1023
+        with pytest.raises(ValueError, match="Operation resulted in overflow"):
+            self.calculator.power(2, 1024)
+        with pytest.raises(ValueError, match="Operation resulted in overflow"):
+            self.calculator.power(10, 10 ** 9)
+        assert self.calculator.get_last_result() == 2 ** 1023
+    
+    def test_power_half_matches_square_root(self):
+        """Test that exponent 0.5 agrees with square_root."""
+        for number in [0, 2, 16, 12345.678]:
+            assert self.calculator.power(number, 0.5) == self.calculator.square_root(number)
+        assert math.copysign(1.0, self.calculator.power(-0.0, 0.5)) == 1.0
+        with pytest.raises(ValueError, match="Operation resulted in invalid number"):
+            self.calculator.power(float('inf'), 0.5)
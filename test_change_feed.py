@@ -0,0 +1,99 @@
+"""Unit tests for the History change feed using pytest."""
+
+import threading
+import pytest
+from change_feed import ChangeFeed, FeedOverrunError
+from history import History
+
+
+class TestChangeFeed:
+    """Test suite for ChangeFeed and History.subscribe."""
+
+    def setup_method(self):
+        self.history = History(max_size=5)
+
+    def test_drain_returns_new_entries_in_order(self):
+        """Test that a cursor sees entries added after subscribing."""
+        self.history.add_operation("add", [0, 1], 1)
+        cursor = self.history.subscribe()
+
+        self.history.add_operation("add", [1, 1], 2)
+        self.history.add_operation("multiply", [2, 3], 6)
+        batch = cursor.drain()
+
+        assert [seq for seq, _ in batch] == [0, 1]
+        assert [entry['result'] for _, entry in batch] == [2, 6]
+        assert cursor.drain() == []
+
+    def test_sequence_numbers_survive_eviction(self):
+        """Test that sequence numbers keep increasing past max_size."""
+        cursor = self.history.subscribe()
+        sequences = []
+
+        for i in range(12):
+            self.history.add_operation("add", [i, 1], i + 1)
+            sequences.extend(seq for seq, _ in cursor.drain())
+
+        assert sequences == list(range(12))
+        assert self.history.get_operation_count() == 5
+
+    def test_batched_drain(self):
+        """Test draining with a batch size limit."""
+        cursor = self.history.subscribe()
+        for i in range(4):
+            self.history.add_operation("add", [i, 1], i + 1)
+
+        first = cursor.drain(max_items=3)
+        second = cursor.drain(max_items=3)
+
+        assert [seq for seq, _ in first] == [0, 1, 2]
+        assert [seq for seq, _ in second] == [3]
+        assert cursor.pending() == 0
+
+    def test_overrun_signalled_when_consumer_falls_behind(self):
+        """Test that a lagging cursor gets an explicit overrun."""
+        cursor = self.history.subscribe()
+        for i in range(8):
+            self.history.add_operation("add", [i, 1], i + 1)
+
+        with pytest.raises(FeedOverrunError) as excinfo:
+            cursor.drain()
+
+        assert excinfo.value.missed == 3
+        # The cursor resumes from the oldest retained entry
+        assert [seq for seq, _ in cursor.drain()] == [3, 4, 5, 6, 7]
+
+    def test_subscribe_from_start(self):
+        """Test that from_start replays entries still held in the buffer."""
+        feed = ChangeFeed(capacity=3)
+        for i in range(5):
+            feed.publish({'result': i})
+
+        cursor = feed.subscribe(from_start=True)
+
+        assert [entry['result'] for _, entry in cursor.drain()] == [2, 3, 4]
+
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="Change feed capacity must be positive"):
+            ChangeFeed(capacity=0)
+
+    def test_consumer_thread_sees_every_entry(self):
+        """Test draining from another thread while the producer writes."""
+        history = History(max_size=100_000)
+        cursor = history.subscribe()
+        received = []
+        done = threading.Event()
+
+        def consume():
+            while not done.is_set() or cursor.pending():
+                received.extend(seq for seq, _ in cursor.drain(max_items=256))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(10_000):
+            history.add_operation("add", [i, 1], i + 1)
+        done.set()
+        consumer.join()
+
+        assert received == list(range(10_000))
@@ -306,4 +306,363 @@ class TestHistory:
         assert len(recent) == 3
         expected_operations = ["square_root", "power", "divide"]
         actual_operations = [op['operation'] for op in recent]
-        assert actual_operations == expected_operations
\ No newline at end of file
+        assert actual_operations == expected_operations
+
+
+class TestTieredHistory:
+    """Test suite for History with a compressed cold tier."""
+    
+    def setup_method(self):
+        self.history = History(max_size=3, cold_max_bytes=10_000, cold_block_size=4)
+    
+    def test_evicted_entries_kept_in_cold_tier(self):
+        """Test that evicted entries move to the cold tier instead of being lost."""
+        for i in range(12):
+            self.history.add_operation("add", [i, 1], i + 1)
+        
+        assert self.history.get_operation_count() == 3
+        assert self.history.get_operation_count(include_cold=True) == 12
+        assert len(self.history.cold.blocks) == 2
+        assert len(self.history.cold.staging) == 1
+    
+    def test_cold_entries_round_trip(self):
+        """Test that compressed entries decode to the original values."""
+        for i in range(10):
+            self.history.add_operation("multiply", [i, 2.5], i * 2.5)
+        original = self.history.cold.blocks[0]
+        
+        entries = original.decode(self.history.cold.op_names)
+        
+        assert [entry['operands'] for entry in entries] == [[i, 2.5] for i in range(4)]
+        assert [entry['result'] for entry in entries] == [i * 2.5 for i in range(4)]
+        assert entries[0]['timestamp'] == original.first_timestamp
+        assert entries[-1]['timestamp'] == original.last_timestamp
+    
+    def test_search_spans_both_tiers(self):
+        """Test searching across hot and cold tiers, most recent first."""
+        for i in range(12):
+            op = "add" if i % 3 == 0 else "subtract"
+            self.history.add_operation(op, [i, 1], i)
+        
+        hot_only = self.history.search_operations("add")
+        both = self.history.search_operations("add", include_cold=True)
+        
+        assert [op['result'] for op in hot_only] == [9]
+        assert [op['result'] for op in both] == [9, 6, 3, 0]
+        assert self.history.search_operations("divide", include_cold=True) == []
+    
+    def test_statistics_span_both_tiers(self):
+        """Test that statistics with include_cold cover every retained entry."""
+        for i in range(12):
+            self.history.add_operation("add" if i < 6 else "divide", [i, 1], i)
+        
+        stats = self.history.get_statistics(include_cold=True)
+        
+        assert stats['total_operations'] == 12
+        assert stats['operation_types'] == {'add': 6, 'divide': 6}
+        assert stats['average_result'] == sum(range(12)) / 12
+        assert stats['max_result'] == 11
+        assert stats['min_result'] == 0
+        assert self.history.get_statistics()['total_operations'] == 3
+    
+    def test_cold_byte_budget_drops_oldest_blocks(self):
+        """Test that the cold tier stays within its byte budget."""
+        history = History(max_size=2, cold_max_bytes=200, cold_block_size=4)
+        
+        for i in range(200):
+            history.add_operation("add", [i, 1], i + 1)
+        
+        assert history.cold.compressed_bytes <= 200
+        oldest = history.cold.blocks[0].decode(history.cold.op_names)
+        assert oldest[0]['result'] > 1
+    
+    def test_clear_history_clears_cold_tier(self):
+        """Test that clearing history also empties the cold tier."""
+        for i in range(12):
+            self.history.add_operation("add", [i, 1], i + 1)
+        
+        self.history.clear_history()
+        
+        assert self.history.get_operation_count(include_cold=True) == 0
+        assert self.history.get_statistics(include_cold=True)['total_operations'] == 0
+
+
+class TestMemoryBoundedHistory:
+    """Test suite for History with a byte budget."""
+    
+    def test_memory_usage_tracks_inserts_and_clear(self):
+        """Test that memory accounting grows on insert and resets on clear."""
+        history = History(max_bytes=10 ** 9)
+        assert history.get_memory_usage() == 0
+        
+        history.add_operation("add", [1, 2], 3)
+        one_entry = history.get_memory_usage()
+        history.add_operation("add", [1, 2], 3)
+        
+        assert one_entry > 0
+        assert history.get_memory_usage() == 2 * one_entry
+        
+        history.clear_history()
+        assert history.get_memory_usage() == 0
+    
+    def test_larger_entries_cost_more(self):
+        """Test that entry size reflects operand count and int size."""
+        history = History(max_bytes=10 ** 9)
+        history.add_operation("square_root", [4], 2)
+        small = history.get_memory_usage()
+        history.clear_history()
+        history.add_operation("power", [10 ** 200, 2], 10 ** 400)
+        
+        assert history.get_memory_usage() > small
+    
+    def test_byte_budget_evicts_oldest(self):
+        """Test that the oldest entries are evicted to stay within budget."""
+        probe = History(max_bytes=10 ** 9)
+        probe.add_operation("add", [1, 2], 3)
+        entry_size = probe.get_memory_usage()
+        history = History(max_bytes=entry_size * 3)
+        
+        for i in range(10):
+            history.add_operation("add", [i, 1], i + 1)
+        
+        assert history.get_operation_count() == 3
+        assert history.get_memory_usage() <= entry_size * 3
+        assert [op['result'] for op in history.get_all_operations()] == [10, 9, 8]
+    
+    def test_big_entry_evicts_several_small_ones(self):
+        """Test that one large entry can push out several small ones."""
+        probe = History(max_bytes=10 ** 9)
+        probe.add_operation("add", [1, 2], 3)
+        history = History(max_bytes=probe.get_memory_usage() * 4)
+        for i in range(4):
+            history.add_operation("add", [i, 1], i + 1)
+        
+        history.add_operation("power", [10 ** 100, 3], 10 ** 300)
+        
+        assert history.get_operation_count() < 4
+        assert history.get_all_operations()[0]['operation'] == "power"
+        assert history.get_memory_usage() <= history.max_bytes
+    
+    def test_byte_budget_evictions_go_to_cold_tier(self):
+        """Test that byte-budget eviction feeds the cold tier in tiered mode."""
+        probe = History(max_bytes=10 ** 9)
+        probe.add_operation("add", [1, 2], 3)
+        history = History(max_bytes=probe.get_memory_usage() * 2, cold_max_bytes=10_000)
+        
+        for i in range(6):
+            history.add_operation("add", [i, 1], i + 1)
+        
+        assert history.get_operation_count() == 2
+        assert history.get_operation_count(include_cold=True) == 6
+    
+    def test_byte_budget_replaces_default_entry_limit(self):
+        """Test that a byte budget alone does not cap history at 100 entries."""
+        history = History(max_bytes=10 ** 9)
+        
+        for i in range(500):
+            history.add_operation("add", [i, 1], i + 1)
+        
+        assert history.get_operation_count() == 500
+        assert History(max_size=50, max_bytes=10 ** 9).max_size == 50
+    
+    def test_memory_not_tracked_without_budget(self):
+        """Test that entry sizes are only estimated when max_bytes is set."""
+        history = History()
+        history.add_operation("add", [1, 2], 3)
+        
+        assert history.get_memory_usage() is None
+        assert history._entry_sizes == []
+    
+    def test_negative_byte_budget(self):
+        """Test that a negative byte budget is rejected."""
+        with pytest.raises(ValueError, match="History byte budget cannot be negative"):
+            History(max_bytes=-1)
+
+
+class TestPartitionedHistory:
+    """Test suite for map-reduce statistics and search over partitions."""
+    
+    OPERATIONS = ["add", "subtract", "multiply", "divide", "power", "square_root"]
+    
+    def _fill(self, history, count=500):
+        import random
+        rng = random.Random(42)
+        for i in range(count):
+            op = self.OPERATIONS[i % len(self.OPERATIONS)]
+            if i % 3 == 0:
+                result = rng.randint(-10 ** 6, 10 ** 6)
+            else:
+                result = rng.uniform(-1.0, 1.0) * 10 ** rng.randint(-20, 20)
+            history.add_operation(op, [i, 1], result)
+    
+    def test_partitioned_statistics_match_serial(self):
+        """Test that every partitioning gives exactly the same statistics."""
+        reference = History(max_size=1000, partitions=2)
+        self._fill(reference)
+        expected = reference.get_statistics()
+        
+        for partition_by in ["time", "operation"]:
+            for partitions in [2, 3, 7]:
+                history = History(max_size=1000, partitions=partitions, partition_by=partition_by)
+                self._fill(history)
+                
+                assert history.get_statistics() == expected
+        
+        unpartitioned = History(max_size=1000)
+        self._fill(unpartitioned)
+        stats = unpartitioned.get_statistics()
+        assert stats['average_result'] == pytest.approx(expected['average_result'])
+        assert stats['max_result'] == expected['max_result']
+        assert stats['min_result'] == expected['min_result']
+    
+    def test_unpartitioned_average_keeps_left_to_right_sum(self):
+        """Test that the default path still sums results like sum() does."""
+        history = History()
+        for result in [0.1, 0.2, 0.3]:
+            history.add_operation("add", [0, 0], result)
+        
+        assert history.get_statistics()['average_result'] == 0.20000000000000004
+    
+    def test_partitioned_search_matches_serial(self):
+        """Test that partitioned searches return the serial results in order."""
+        serial = History(max_size=1000)
+        self._fill(serial)
+        
+        for partition_by in ["time", "operation"]:
+            history = History(max_size=1000, partitions=4, partition_by=partition_by)
+            self._fill(history)
+            
+            for op in self.OPERATIONS + ["modulo"]:
+                expected = [entry['result'] for entry in serial.search_operations(op)]
+                actual = [entry['result'] for entry in history.search_operations(op)]
+                assert actual == expected
+    
+    def test_thread_pool_map_reduce(self):
+        """Test running statistics and search on a thread pool."""
+        from concurrent.futures import ThreadPoolExecutor
+        history = History(max_size=1000, partitions=4)
+        self._fill(history)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stats = history.get_statistics(executor=executor)
+            found = history.search_operations("divide", executor=executor)
+        
+        assert stats == history.get_statistics()
+        assert found == history.search_operations("divide")
+    
+    def test_process_pool_map_reduce(self):
+        """Test running statistics on a process pool."""
+        from concurrent.futures import ProcessPoolExecutor
+        history = History(max_size=1000, partitions=2, partition_by="operation")
+        self._fill(history, count=200)
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            stats = history.get_statistics(executor=executor)
+        
+        assert stats == history.get_statistics()
+    
+    def test_operation_partitions_follow_eviction(self):
+        """Test that per-operation partitions stay in step with eviction and clear."""
+        history = History(max_size=50, partitions=3, partition_by="operation")
+        self._fill(history, count=200)
+        
+        assert sum(len(p) for p in history._operation_partitions) == 50
+        assert len(history.search_operations("add")) == len(
+            [op for op in history.get_all_operations() if op['operation'] == "add"]
+        )
+        
+        history.clear_history()
+        assert all(p == [] for p in history._operation_partitions)
+    
+    def test_statistics_sum_is_order_independent(self):
+        """Test that float sums do not depend on how entries are grouped."""
+        history = History(partitions=2)
+        for result in [1e16, 1.0, -1e16, 1.0]:
+            history.add_operation("add", [0, 0], result)
+        
+        assert history.get_statistics()['average_result'] == 0.5
+    
+    def test_overflowing_float_sum(self):
+        """Test that float sums beyond the double range give inf, not an error."""
+        for history in [History(), History(partitions=2), History(partitions=3, partition_by="operation")]:
+            history.add_operation("add", [0, 0], 1e308)
+            history.add_operation("multiply", [0, 0], 1e308)
+            
+            assert history.get_statistics()['average_result'] == float('inf')
+        
+        negative = History(partitions=2)
+        negative.add_operation("add", [0, 0], -1e308)
+        negative.add_operation("add", [0, 0], -1e308)
+        assert negative.get_statistics()['average_result'] == float('-inf')
+    
+    def test_overflowing_float_sum_in_cold_tier(self):
+        """Test that sealing cold blocks with overflowing sums keeps working."""
+        for partitions in [1, 2]:
+            history = History(max_size=1, cold_max_bytes=10 ** 6, cold_block_size=2,
+                              partitions=partitions)
+            for _ in range(6):
+                history.add_operation("add", [0, 0], 1e308)
+            
+            assert history.get_operation_count(include_cold=True) == 6
+            assert history.get_statistics(include_cold=True)['average_result'] == float('inf')
+    
+    def test_nan_bounds_match_serial(self):
+        """Test that NaN results give the same bounds on every path."""
+        nan = float('nan')
+        for results, expected_max, expected_min in [([1.0, nan, 2.0], 2.0, 1.0),
+                                                    ([2.0, 1.0, nan], 2.0, 1.0)]:
+            for partitions, partition_by in [(1, "time"), (2, "time"), (3, "time"), (3, "operation")]:
+                history = History(partitions=partitions, partition_by=partition_by)
+                for op, result in zip(["add", "subtract", "multiply"], results):
+                    history.add_operation(op, [0, 0], result)
+                
+                stats = history.get_statistics()
+                
+                assert stats['max_result'] == expected_max
+                assert stats['min_result'] == expected_min
+    
+    def test_leading_nan_makes_bounds_nan(self):
+        """Test that a NaN oldest result makes both bounds NaN, like max() does."""
+        import math
+        for partitions, partition_by in [(1, "time"), (2, "time"), (3, "operation")]:
+            history = History(partitions=partitions, partition_by=partition_by)
+            for op, result in zip(["add", "subtract", "multiply"], [float('nan'), 1.0, 2.0]):
+                history.add_operation(op, [0, 0], result)
+            
+            stats = history.get_statistics()
+            
+            assert math.isnan(stats['max_result'])
+            assert math.isnan(stats['min_result'])
+    
+    def test_mixed_sign_overflow_is_partition_independent(self):
+        """Test that sums overflowing only part way through stay exact."""
+        results = [1e308, 1e308, -1e308, -1e308, 5.0, 7.0]
+        for partition_by in ["time", "operation"]:
+            for partitions in range(2, 7):
+                history = History(partitions=partitions, partition_by=partition_by)
+                for i, result in enumerate(results):
+                    history.add_operation(self.OPERATIONS[i], [0, 0], result)
+                
+                assert history.get_statistics()['average_result'] == 2.0
+    
+    def test_operation_partition_ties_keep_oldest(self):
+        """Test that equal bounds from different partitions resolve to the oldest entry."""
+        import math
+        from concurrent.futures import ThreadPoolExecutor
+        for older, newer in [(1, 1.0), (0, -0.0), (-0.0, 0)]:
+            history = History(partitions=4, partition_by="operation")
+            history.add_operation("add", [0, 0], older)
+            history.add_operation("subtract", [0, 0], newer)
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for stats in [history.get_statistics(), history.get_statistics(executor=executor)]:
+                    for bound in [stats['max_result'], stats['min_result']]:
+                        assert type(bound) is type(older)
+                        assert math.copysign(1, bound) == math.copysign(1, older)
+    
+    def test_invalid_partitioning(self):
+        """Test that invalid partition settings are rejected."""
+        with pytest.raises(ValueError, match="Partition count must be positive"):
+            History(partitions=0)
+        with pytest.raises(ValueError, match="Unknown partitioning: random"):
+            History(partition_by="random")
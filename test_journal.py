@@ -0,0 +1,114 @@
+"""Tests for journal recording and replay using pytest."""
+
+import pytest
+from journal import JournalWriter, read_journal
+from main import CalculatorWithHistory
+from replay import replay_journal
+
+
+class TestJournal:
+    """Test suite for the operation journal and replay tool."""
+    
+    def setup_method(self):
+        self.calc_with_history = CalculatorWithHistory()
+    
+    def test_recorded_calls_round_trip(self, tmp_path):
+        """Test that recorded calls read back with identical values."""
+        path = str(tmp_path / "calls.jrn")
+        self.calc_with_history.start_recording(path)
+        self.calc_with_history.add(10, 5)
+        self.calc_with_history.divide(1, 3)
+        self.calc_with_history.power(7, 300)
+        self.calc_with_history.square_root(2)
+        self.calc_with_history.stop_recording()
+        
+        records = list(read_journal(path))
+        
+        assert [r.operation for r in records] == ['add', 'divide', 'power', 'square_root']
+        assert records[0].operands == [10, 5]
+        assert records[1].result == 1 / 3
+        assert records[2].result == 7 ** 300
+        assert records[3].operands == [2]
+        offsets = [r.offset_ns for r in records]
+        assert offsets == sorted(offsets)
+    
+    def test_failed_calls_are_recorded(self, tmp_path):
+        """Test that errors are journaled but still not kept in history."""
+        path = str(tmp_path / "errors.jrn")
+        self.calc_with_history.start_recording(path)
+        
+        with pytest.raises(ZeroDivisionError):
+            self.calc_with_history.divide(10, 0)
+        self.calc_with_history.stop_recording()
+        
+        records = list(read_journal(path))
+        assert len(records) == 1
+        assert records[0].error == "ZeroDivisionError: Cannot divide by zero"
+        assert self.calc_with_history.get_history() == []
+    
+    def test_replay_matches_recording(self, tmp_path):
+        """Test that replaying a recording reproduces every outcome."""
+        path = str(tmp_path / "session.jrn")
+        self.calc_with_history.start_recording(path)
+        for i in range(50):
+            self.calc_with_history.multiply(i, 0.1)
+            self.calc_with_history.power(2, i)
+        with pytest.raises(ValueError):
+            self.calc_with_history.square_root(-1)
+        self.calc_with_history.stop_recording()
+        
+        report = replay_journal(path)
+        
+        assert report['operations'] == 101
+        assert report['mismatches'] == []
+        assert report['latency_p50_us'] <= report['latency_p99_us'] <= report['latency_max_us']
+    
+    def test_replay_detects_bitwise_mismatch(self, tmp_path):
+        """Test that a result differing in the last bit is reported."""
+        path = str(tmp_path / "tampered.jrn")
+        with JournalWriter(path) as journal:
+            journal.record('add', [0.1, 0.2], 0.1 + 0.2)
+            journal.record('add', [0.1, 0.2], 0.3)
+        
+        report = replay_journal(path)
+        
+        assert report['mismatches'] == [1]
+    
+    def test_paced_replay_follows_recorded_timing(self, tmp_path):
+        """Test that paced replay takes at least the recorded duration."""
+        path = str(tmp_path / "paced.jrn")
+        with JournalWriter(path) as journal:
+            journal.record('add', [1, 2], 3)
+        records = list(read_journal(path))
+        
+        report = replay_journal(path, paced=True)
+        
+        assert report['elapsed_seconds'] >= records[-1].offset_ns / 1e9
+        assert report['mismatches'] == []
+    
+    def test_rejects_non_journal_file(self, tmp_path):
+        """Test that reading a file without the journal header fails."""
+        path = tmp_path / "bogus.jrn"
+        path.write_bytes(b"not a journal")
+        
+        with pytest.raises(ValueError, match="Not a calculator journal"):
+            list(read_journal(str(path)))
+    
+    def test_unsupported_values_do_not_change_outcome(self, tmp_path):
+        """Test that values the journal cannot encode are skipped, not raised."""
+        from fractions import Fraction
+        path = str(tmp_path / "fractions.jrn")
+        self.calc_with_history.start_recording(path)
+        
+        result = self.calc_with_history.add(Fraction(1, 2), 1)
+        with pytest.raises(ZeroDivisionError, match="Cannot divide by zero"):
+            self.calc_with_history.divide(Fraction(1, 2), 0)
+        self.calc_with_history.add(1, 2)
+        skipped = self.calc_with_history.journal.skipped
+        self.calc_with_history.stop_recording()
+        
+        assert result == Fraction(3, 2)
+        assert self.calc_with_history.get_history(1)[0]['result'] == 3
+        assert len(self.calc_with_history.get_history()) == 2
+        assert skipped == 2
+        assert [r.operands for r in read_journal(path)] == [[1, 2]]